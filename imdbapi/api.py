@@ -1,11 +1,14 @@
 import pprint
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from sys import intern
 from typing import Union, TypeVar, Generic
 
 from .bareapi.api import (ImdbApi as BareApi, ApiError, ImageSize, ImageUrl,
                          image_info_from_url, AspectRatio, PosterSize, PosterUrl, CacheInfo,
                          PersonUrl, TitleUrl, FullCastUrl)
+from .bareapi.caching.caching import LruStore
+from .bareapi.poster import _VALUE_TO_POSTER_SIZE
 
 
 T = TypeVar('T')
@@ -19,39 +22,31 @@ class ApiResult(Generic[T]):
 class ImdbApi:
     def __init__(self, api_back_end):
         self.api = api_back_end
+        self._mapped_searches = LruStore(256)
 
     @classmethod
     def with_default_back_end(cls, api_key: str, caching: CacheInfo):
         return cls(BareApi(api_key, caching))
 
     def search_title(self, search_term: str, *, sync_cache=False) -> ApiResult[list['Title']]:
-        result, cached = self.api.search_title(search_term, sync_cache=sync_cache)
-        return ApiResult(Title.from_result_list(result), cached)
+        return self._search(Title, self.api.search_title, search_term, sync_cache)
 
     def search_series(self, search_term: str, *, sync_cache=False) -> ApiResult[list['Title']]:
-        result, cached = self.api.search_series(search_term, sync_cache=sync_cache)
-        return ApiResult(Title.from_result_list(result), cached)
+        return self._search(Title, self.api.search_series, search_term, sync_cache)
 
     def search_movie(self, search_term: str, *, sync_cache=False) -> ApiResult[list['Title']]:
-        result, cached = self.api.search_movie(search_term, sync_cache=sync_cache)
-        return ApiResult(Title.from_result_list(result), cached)
+        return self._search(Title, self.api.search_movie, search_term, sync_cache)
 
     def search_episode(self, search_term: str, *, sync_cache=False) -> ApiResult[list['Title']]:
-        result, cached = self.api.search_episode(search_term, sync_cache=sync_cache)
-        return ApiResult(Title.from_result_list(result), cached)
+        return self._search(Title, self.api.search_episode, search_term, sync_cache)
 
     def search_name(self, search_term: str, *, sync_cache=False) -> ApiResult[list[dict]]:
-        result, cached = self.api.search_name(search_term, sync_cache=sync_cache)
-        return ApiResult(Name.from_result_list(result), cached)
+        return self._search(Name, self.api.search_name, search_term, sync_cache)
 
     def title(self, id, *options, sync_cache=False) -> ApiResult[Union[dict, 'TVSeries', 'Movie']]:
         result, cached = self.api.title(id, *options, sync_cache=sync_cache)
-        if result['type'] == 'TVSeries':
-            return ApiResult(TVSeries.from_result(result), cached)
-        if result['type'] == 'Movie':
-            return ApiResult(Movie.from_result(result), cached)
-        else:
-            return ApiResult(result, cached)
+        ctor = _TYPE_DISPATCH.get(result['type'])
+        return ApiResult(ctor(result) if ctor else result, cached)
 
     def tv_series(self, id, *options, sync_cache=False) -> ApiResult['TVSeries']:
         result, cached = self.api.title(id, *options, sync_cache=sync_cache)
@@ -69,13 +64,17 @@ class ImdbApi:
         return ApiResult(Season.from_result(result, int(season_num)), cached)
 
     def all_seasons(self, series: 'TVSeries', *, sync_cache=False) -> ApiResult[list['Season']]:
-        any_cached = False
-        init_results = [self.season(series, season, sync_cache=sync_cache)
-                        for season in series]
-        seasons: list[Season] = []
-        for api_result in init_results:
-            seasons.append(api_result.result)
-            any_cached = any_cached or api_result.cached
+        season_nums = [str(season) for season in series]
+        # batched lookups are optional on the back end; fall back to one call per season
+        look_up_seasons = getattr(self.api, 'seasons', None)
+        if look_up_seasons is None:
+            results = [self.api.season(series.id, season_num, sync_cache=sync_cache)
+                       for season_num in season_nums]
+        else:
+            results = look_up_seasons(series.id, season_nums, sync_cache=sync_cache)
+        seasons: list[Season] = [Season.from_result(result, int(season_num))
+                                 for season_num, (result, _) in zip(season_nums, results)]
+        any_cached = any(cached for _, cached in results)
         return ApiResult(seasons, any_cached)
 
     def look_up_full_title_data(self, title: 'Title', *, sync_cache=False) -> ApiResult[Union[dict,
@@ -85,8 +84,22 @@ class ImdbApi:
     def check_usage(self):
         return self.api.check_usage()
 
+    def _search(self, cls, search, search_term, sync_cache):
+        results, cached = search(search_term, sync_cache=sync_cache)
+        # comparing against the last payload for this search is cheaper than
+        # remapping it, and stays correct if the results have changed since
+        key = (cls, search, search_term)
+        memo = self._mapped_searches.get(key)
+        if memo is not None and memo[0] == results:
+            return ApiResult(list(memo[1]), cached)
+        mapped = cls.from_result_list(results)
+        self._mapped_searches[key] = (results, tuple(mapped))
+        return ApiResult(mapped, cached)
+
 
 class Mappable(ABC):
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def from_result(cls, result):
@@ -96,13 +109,23 @@ class Mappable(ABC):
     def from_result_list(cls, results):
         if results is None:
             return []
-        return [cls.from_result(result) for result in results]
+        from_result = cls.from_result
+        return [from_result(result) for result in results]
 
     @property
     @abstractmethod
     def imdb_link(self):
         ...
 
+    # frozen dataclasses with hand-written __slots__ get no state hooks, and the
+    # default slot restore goes through the frozen __setattr__
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
     def __format__(self, format_spec):
         if format_spec == '':
             return str(self)
@@ -118,8 +141,9 @@ class Mappable(ABC):
         ...
 
 
-@dataclass
+@dataclass(frozen=True)
 class Title(Mappable):
+    __slots__ = ('id', 'title', 'image', 'description')
     id: str
     title: str
     image: str
@@ -128,7 +152,7 @@ class Title(Mappable):
     @classmethod
     def from_result(cls, result):
         return cls(
-                result['id'],
+                intern(result['id']),
                 result['title'],
                 result['image'],
                 result['description'])
@@ -144,8 +168,10 @@ class Title(Mappable):
         return f'{self.id} - {self.title}'
 
 
-@dataclass
+@dataclass(frozen=True)
 class TVSeries(Mappable):
+    __slots__ = ('id', 'title', 'full_title', 'image', 'cast', 'plot', 'genres', 'imdb_rating',
+                 'posters', 'seasons')
     id: str
     title: str
     full_title: str
@@ -161,7 +187,7 @@ class TVSeries(Mappable):
     def from_result(cls, result):
         posters = result['posters']
         return cls(
-            result['id'],
+            intern(result['id']),
             result['title'],
             result['fullTitle'],
             Image.from_result(result['image']),
@@ -193,8 +219,9 @@ class TVSeries(Mappable):
         return f'{self.id} - {self.full_title}'
 
 
-@dataclass
+@dataclass(frozen=True)
 class Season(Mappable):
+    __slots__ = ('show_id', 'show_title', 'season_number', 'episodes')
     show_id: str
     show_title: str
     season_number: int
@@ -207,12 +234,13 @@ class Season(Mappable):
                 season_number = result['season_number']
             else:
                 raise KeyError('season number was not passed in via result or direct argument')
+        show_id = intern(result['imDbId'])
         return cls(
-            result['imDbId'],
+            show_id,
             result['title'],
             int(season_number),
             Episode.from_result_list(
-                result['episodes'], result['imDbId'], result['title']))
+                result['episodes'], show_id, result['title']))
 
     def __iter__(self):
         return iter(self.episodes)
@@ -228,8 +256,10 @@ class Season(Mappable):
         return f'Season {self.season_number} of {self.show_title} ({self.show_id})'
 
 
-@dataclass
+@dataclass(frozen=True)
 class Episode(Mappable):
+    __slots__ = ('id', 'title', 'show_id', 'show_title', 'season', 'episode', 'image',
+                 'release_date', 'plot', 'imdb_rating')
     id: str
     title: str
     show_id: str
@@ -254,8 +284,12 @@ class Episode(Mappable):
             else:
                 raise KeyError('series title was not passed in via result or direct argument')
 
+        return cls._build(result, show_id, show_title)
+
+    @classmethod
+    def _build(cls, result, show_id, show_title):
         return cls(
-            result['id'],
+            intern(result['id']),
             result['title'],
             show_id,
             show_title,
@@ -271,10 +305,8 @@ class Episode(Mappable):
         if results is None:
             return None
 
-        for result in results:
-            result['show_id'] = show_id
-            result['show_title'] = show_title
-        return super().from_result_list(results)
+        build = cls._build
+        return [build(result, show_id, show_title) for result in results]
 
     @property
     def imdb_link(self):
@@ -287,8 +319,10 @@ class Episode(Mappable):
         return f'{self.id} - {self.title} (S{self.season}E{self.episode} of {self.show_title})'
 
 
-@dataclass
+@dataclass(frozen=True)
 class Movie(Mappable):
+    __slots__ = ('id', 'title', 'full_title', 'image', 'cast', 'plot', 'genres', 'imdb_rating',
+                 'posters')
     id: str
     title: str
     full_title: str
@@ -303,7 +337,7 @@ class Movie(Mappable):
     def from_result(cls, result):
         posters = result['posters']
         return cls(
-            result['id'],
+            intern(result['id']),
             result['title'],
             result['fullTitle'],
             result['image'],
@@ -324,8 +358,9 @@ class Movie(Mappable):
         return f'{self.id}: {self.full_title}'
 
 
-@dataclass
+@dataclass(frozen=True)
 class CastMember(Mappable):
+    __slots__ = ('id', 'name', 'as_character', 'image')
     id: str
     name: str
     as_character: str
@@ -334,12 +369,12 @@ class CastMember(Mappable):
     @classmethod
     def from_result(cls, result):
         # asCharacter is coming in weird, saying stuff like 'Tophas Toph'
-        as_ = result['asCharacter']
-        as_end = ((len(as_) - 3) // 2)
+        character = result['asCharacter']
+        half = (len(character) - 3) >> 1
         return cls(
-            result['id'],
+            intern(result['id']),
             result['name'],
-            as_[:as_end],
+            intern(character[:half]),
             Image.from_result(result['image']))
 
     @property
@@ -350,8 +385,9 @@ class CastMember(Mappable):
         return f'{self.id}: {self.name} as {self.as_character}'
 
 
-@dataclass
+@dataclass(frozen=True)
 class Name(Mappable):
+    __slots__ = ('id', 'name', 'image')
     id: str
     name: str
     image: 'Image'
@@ -359,7 +395,7 @@ class Name(Mappable):
     @classmethod
     def from_result(cls, result):
         return cls(
-            result['id'],
+            intern(result['id']),
             result['title'],
             Image.from_result(result['image']))
 
@@ -371,8 +407,9 @@ class Name(Mappable):
         return f'{self.id}: {self.name}'
 
 
-@dataclass
+@dataclass(frozen=True)
 class Poster(Mappable):
+    __slots__ = ('id', 'size', 'link')
     id: str
     size: PosterSize
     link: str
@@ -387,7 +424,11 @@ class Poster(Mappable):
     @staticmethod
     def read_size_from_url(url: str):
         end_of_size = url.find('/', 28)
-        return PosterSize(url[28:end_of_size])
+        size = url[28:end_of_size]
+        try:
+            return _VALUE_TO_POSTER_SIZE[size]
+        except KeyError:
+            return PosterSize(size)
 
     def with_size(self, size: PosterSize):
         return Poster(
@@ -403,8 +444,9 @@ class Poster(Mappable):
         return f'{self.id}: {self.size.name}'
 
 
-@dataclass
+@dataclass(frozen=True)
 class Image(Mappable):
+    __slots__ = ('id', 'size', 'aspect_ratio', 'link')
     id: str
     size: ImageSize
     aspect_ratio: AspectRatio
@@ -433,3 +475,9 @@ class Image(Mappable):
 
     def _short_format(self):
         return f'{self.id}: {str(self.size)}'
+
+
+_TYPE_DISPATCH = {
+    'TVSeries': TVSeries.from_result,
+    'Movie': Movie.from_result,
+}
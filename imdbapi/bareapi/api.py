@@ -1,23 +1,41 @@
 import pprint
 from abc import ABC, abstractmethod
 
-import requests
 import logging
+import time
+
+import orjson
 
 from .image import ImageUrl, ImageSize, image_info_from_url, AspectRatio
 from .poster import PosterSize, PosterUrl
 from .caching.req_cache import RequestsSQLiteBackedMemoryCache
+from .session import SESSION, fetch_all
 
 __all__ = ['ImdbApi', 'ApiError', 'ImageUrl', 'image_info_from_url', 'CacheInfo',
            'ImageSize', 'AspectRatio', 'PosterSize', 'PosterUrl', 'TitleUrl',
            'PersonUrl', 'FullCastUrl']
 
 
+API_URL_ROOT = 'https://imdb-api.com/en/API/'
+USAGE_CACHE_SECONDS = 5.0
+
+
 class CacheInfo(ABC):
     @abstractmethod
-    def get(self, arg: str, sync_cache=False):
+    def get(self, arg: str, sync_cache=False) -> tuple[bytes, bool]:
         ...
 
+    def get_json(self, url: str, sync_cache=False) -> tuple[dict, bool]:
+        content, from_cache = self.get(url, sync_cache)
+        return orjson.loads(content), from_cache
+
+    def get_many(self, urls: list[str], sync_cache=False) -> list[tuple[bytes, bool]]:
+        return [self.get(url, sync_cache) for url in urls]
+
+    def get_json_many(self, urls: list[str], sync_cache=False) -> list[tuple[dict, bool]]:
+        return [(orjson.loads(content), from_cache)
+                for content, from_cache in self.get_many(urls, sync_cache)]
+
     @staticmethod
     def of(db_path: str, mem_cache_max_size: int):
         return UseCache(RequestsSQLiteBackedMemoryCache(db_path, mem_cache_max_size))
@@ -34,17 +52,24 @@ class UseCache(CacheInfo):
     def get(self, arg: str, sync_cache=False):
         return self.cache(arg, sync_cache=sync_cache)
 
+    def get_many(self, urls: list[str], sync_cache=False):
+        return self.cache.get_many(urls, sync_cache=sync_cache)
+
 
 class NoCache(CacheInfo):
     def get(self, url: str, sync_cache=False):
-        return requests.get(url), False
+        return SESSION.get(url).content, False
+
+    def get_many(self, urls: list[str], sync_cache=False):
+        return [(content, False) for content in fetch_all(urls)]
 
 
 class ImdbApi:
     def __init__(self, api_key: str, cache_info: CacheInfo):
         self.requester = cache_info
         self.api_key = api_key
-
+        self._key_path = f'/{api_key}/'
+        self._usage_cache = (float('-inf'), (0, 100))
     def search_title(self, search_term: str, sync_cache=False) -> tuple[dict, bool]:
         url = self._make_url('SearchTitle', search_term)
         logging.info(f'running title search: {url}')
@@ -81,6 +106,17 @@ class ImdbApi:
         logging.info(f'running season details lookup: {url}')
         return self._request_json(url, sync_cache)
 
+    def seasons(self, show_id: str, season_nums: list[str],
+                sync_cache=False) -> list[tuple[dict, bool]]:
+        urls = [self._make_url('SeasonEpisodes', show_id, season_num)
+                for season_num in season_nums]
+        logging.info(f'running season details lookups: {urls}')
+        results = self.requester.get_json_many(urls, sync_cache)
+        for json, _ in results:
+            if json['errorMessage']:
+                raise ApiError(json['errorMessage'])
+        return results
+
     def download_poster(self, poster_id, size: 'PosterSize', sync_cache=False) -> tuple[bytes,
                                                                                         bool]:
         url = PosterUrl.with_size(poster_id, size)
@@ -93,37 +129,44 @@ class ImdbApi:
         return self._request_content(url, sync_cache)
 
     def check_usage(self) -> tuple[int, int]:
+        now = time.monotonic()
+        checked_at, usage = self._usage_cache
+        if now - checked_at < USAGE_CACHE_SECONDS:
+            return usage
         url = self._make_url('Usage')
         logging.info(f'checking usage amount')
-        json = requests.get(url).json()
+        json = orjson.loads(SESSION.get(url).content)
         if json['errorMessage']:
-            return 0, 100
+            usage = 0, 100
         else:
-            return json['count'], json['maximum']
+            usage = json['count'], json['maximum']
+        self._usage_cache = (now, usage)
+        return usage
 
     def _request_json_results(self, url, sync_cache) -> tuple[dict, bool]:
-        response, from_cache = self.requester.get(url, sync_cache)
-        json = response.json()
+        json, from_cache = self.requester.get_json(url, sync_cache)
         if json['errorMessage']:
             raise ApiError(json['errorMessage'])
         else:
             return json['results'], from_cache
 
     def _request_json(self, url, sync_cache) -> tuple[dict, bool]:
-        response, from_cache = self.requester.get(url, sync_cache)
-        json = response.json()
+        json, from_cache = self.requester.get_json(url, sync_cache)
         if json['errorMessage']:
             raise ApiError(json['errorMessage'])
         else:
             return json, from_cache
 
     def _request_content(self, url, sync_cache) -> tuple[bytes, bool]:
-        response, from_cache = self.requester.get(url, sync_cache)
-        return response.content, from_cache
+        return self.requester.get(url, sync_cache)
 
     def _make_url(self, endpoint, *terms):
-        url_terms = "/".join((term for term in terms if term != ''))
-        return f'https://imdb-api.com/en/API/{endpoint}/{self.api_key}/{url_terms}'
+        base = API_URL_ROOT + endpoint + self._key_path
+        if not terms:
+            return base
+        if len(terms) == 1:
+            return base + terms[0]
+        return base + '/'.join([term for term in terms if term != ''])
 
 
 class ApiError(Exception):
@@ -131,30 +174,22 @@ class ApiError(Exception):
 
 
 class TitleUrl:
-    TITLE_URL_FORMAT = 'https://www.imdb.com/title/{id}'
-    SEASON_URL_SUFFIX_FORMAT = '/episodes?season={season}'
-
     @classmethod
     def for_id(cls, id):
-        return cls.TITLE_URL_FORMAT.format(id=id)
+        return f'https://www.imdb.com/title/{id}'
 
     @classmethod
     def for_season(cls, id, season):
-        return (cls.TITLE_URL_FORMAT.format(id=id) +
-                cls.SEASON_URL_SUFFIX_FORMAT.format(season=season))
+        return f'https://www.imdb.com/title/{id}/episodes?season={season}'
 
 
 class PersonUrl:
-    PERSON_URL_FORMAT = 'https://www.imdb.com/name/{id}'
-
     @classmethod
     def for_person(cls, id):
-        return cls.PERSON_URL_FORMAT.format(id=id)
+        return f'https://www.imdb.com/name/{id}'
 
 
 class FullCastUrl:
-    FULL_CAST_URL_FORMAT = 'https://www.imdb.com/title/{id}/fullcredits/cast'
-
     @classmethod
     def for_title(cls, id):
-        return cls.FULL_CAST_URL_FORMAT.format(id=id)
+        return f'https://www.imdb.com/title/{id}/fullcredits/cast'
@@ -1,73 +1,147 @@
-import contextlib
 import sqlite3
-from collections import deque
+import threading
+from collections import OrderedDict
+from typing import Iterable, Tuple
 
+import zstandard
 
-@contextlib.contextmanager
-def open_db(db: str):
-    connection = sqlite3.connect(db)
-    cursor = connection.cursor()
-    yield cursor
-    connection.commit()
-    connection.close()
+
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+# zstandard (de)compressors must not be shared between threads
+_zstd = threading.local()
+
+
+def _compress(value: bytes) -> bytes:
+    if not hasattr(_zstd, 'compressor'):
+        _zstd.compressor = zstandard.ZstdCompressor(level=3)
+    return _zstd.compressor.compress(value)
+
+
+def _decompress(blob: bytes) -> bytes:
+    # blobs written before compression was added are stored as-is
+    if not blob.startswith(_ZSTD_MAGIC):
+        return blob
+    if not hasattr(_zstd, 'decompressor'):
+        _zstd.decompressor = zstandard.ZstdDecompressor()
+    return _zstd.decompressor.decompress(blob)
 
 
 class SQLiteKeyValueStore:
     def __init__(self, dbpath):
         self.db = dbpath
-        with open_db(self.db) as db:
-            db.execute('CREATE TABLE IF NOT EXISTS cache'
-                       '(key TEXT PRIMARY KEY ON CONFLICT REPLACE,'
-                       'value BLOB)')
+        # one connection is shared by every thread; the lock keeps a set_many
+        # transaction from picking up other threads' statements
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(dbpath, check_same_thread=False, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('PRAGMA temp_store=MEMORY')
+        self.conn.execute('PRAGMA cache_size=-20000')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS cache'
+                          '(key TEXT PRIMARY KEY ON CONFLICT REPLACE,'
+                          'value BLOB)')
+        with self.lock:
+            self._load_keys()
+
+    def _load_keys(self):
+        # data_version only moves when another connection commits, so it tells
+        # us when the key set may be missing rows written elsewhere
+        self._data_version = self.conn.execute('PRAGMA data_version').fetchone()[0]
+        self._keys = {row[0] for row in self.conn.execute('SELECT key FROM cache')}
+
+    def _has_key(self, key: str) -> bool:
+        if key in self._keys:
+            return True
+        if self.conn.execute('PRAGMA data_version').fetchone()[0] != self._data_version:
+            self._load_keys()
+            return key in self._keys
+        return False
 
     def __setitem__(self, key: str, value):
-        with open_db(self.db) as db:
-            db.execute('INSERT INTO cache VALUES (?, ?)', (key, value))
+        blob = _compress(value)
+        with self.lock:
+            self.conn.execute('INSERT INTO cache VALUES (?, ?)', (key, blob))
+            self._keys.add(key)
         return value
 
+    def set_many(self, items: Iterable[Tuple[str, bytes]]):
+        items = [(key, _compress(value)) for key, value in items]
+        with self.lock, self.conn:
+            self.conn.execute('BEGIN')
+            self.conn.executemany('INSERT INTO cache VALUES (?, ?)', items)
+        with self.lock:
+            self._keys.update(key for key, _ in items)
+
     def __delitem__(self, key: str):
-        with open_db(self.db) as db:
-            db.execute('DELETE FROM cache WHERE key = ?', (key,))
+        with self.lock:
+            self.conn.execute('DELETE FROM cache WHERE key = ?', (key,))
+            self._keys.discard(key)
 
     def __getitem__(self, key: str):
-        with open_db(self.db) as db:
-            result = db.execute('SELECT value FROM cache WHERE key = ?', (key,)).fetchone()
-            if result is None:
-                return result
-            return result[0]
+        with self.lock:
+            if not self._has_key(key):
+                return None
+            result = self.conn.execute('SELECT value FROM cache WHERE key = ?',
+                                       (key,)).fetchone()
+        if result is None:
+            return result
+        return _decompress(result[0])
+
+    def get(self, key: str, default=None):
+        with self.lock:
+            if not self._has_key(key):
+                return default
+            result = self.conn.execute('SELECT value FROM cache WHERE key = ?',
+                                       (key,)).fetchone()
+        if result is None:
+            return default
+        return _decompress(result[0])
 
     def __contains__(self, item):
-        return self[item] is not None
+        with self.lock:
+            return self._has_key(item)
 
     def __iter__(self):
-        with open_db(self.db) as db:
-            db.execute('SELECT * FROM cache')
-            yield from db
+        with self.lock:
+            rows = self.conn.execute('SELECT * FROM cache').fetchall()
+        for key, value in rows:
+            yield key, _decompress(value)
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
 
 
 class LruStore:
     def __init__(self, max_size: int):
-        self.storage = {}
-        self.usage_order = deque((), maxlen=max_size)
+        self.data = OrderedDict()
         self.max_size = max_size
+        self.lock = threading.Lock()
 
     def __getitem__(self, key):
-        if key in self.storage:
-            self.usage_order.remove(key)
-            self.usage_order.append(key)
-        return self.storage[key]
+        with self.lock:
+            self.data.move_to_end(key)
+            return self.data[key]
+
+    def get(self, key, default=None):
+        with self.lock:
+            try:
+                self.data.move_to_end(key)
+            except KeyError:
+                return default
+            return self.data[key]
 
     def __setitem__(self, key, value):
-        if len(self.usage_order) == self.max_size:
-            olditem = self.usage_order[0]
-            self.usage_order.popleft()
-            del self.storage[olditem]
-        self.storage[key] = value
-        self.usage_order.append(key)
+        with self.lock:
+            if key in self.data:
+                self.data.move_to_end(key)
+            elif len(self.data) >= self.max_size:
+                self.data.popitem(last=False)
+            self.data[key] = value
 
     def __delitem__(self, key):
-        self.usage_order.remove(key)
-        del self.storage[key]
+        with self.lock:
+            del self.data[key]
 
     def __contains__(self, key):
-        return key in self.storage
+        return key in self.data
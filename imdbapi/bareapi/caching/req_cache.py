@@ -1,17 +1,9 @@
-import requests
-
+from ..session import SESSION, fetch_all
 from .caching import SQLiteKeyValueStore, LruStore
 
 
-def do_request(url):
-    response = requests.get(url)
-    return response.content, response
-
-
-def recreate_request(content):
-    response = requests.Response()
-    response._content = content
-    return response, True
+def do_request(url) -> bytes:
+    return SESSION.get(url).content
 
 
 class RequestsSQLiteBackedMemoryCache:
@@ -19,24 +11,47 @@ class RequestsSQLiteBackedMemoryCache:
         self.file_cache = SQLiteKeyValueStore(db_path)
         self.mem_cache = LruStore(mem_cache_max_size)
 
-    def __call__(self, url: str, sync_cache=False) -> tuple[requests.Response, bool]:
+    def __call__(self, url: str, sync_cache=False) -> tuple[bytes, bool]:
         if sync_cache:
             return self.sync_cache(url)
         else:
             return self.normal_call(url)
 
     def normal_call(self, url: str):
-        if url in self.mem_cache:
-            return recreate_request(self.mem_cache[url])
-        if url in self.file_cache:
-            content = self.file_cache[url]
-            self.mem_cache[url] = content
-            return recreate_request(content)
+        content = self.lookup(url)
+        if content is not None:
+            return content, True
         else:
             return self.sync_cache(url)
 
+    def lookup(self, url: str):
+        content = self.mem_cache.get(url)
+        if content is not None:
+            return content
+        content = self.file_cache.get(url)
+        if content is not None:
+            self.mem_cache[url] = content
+        return content
+
+    def get_many(self, urls: list[str], sync_cache=False) -> list[tuple[bytes, bool]]:
+        results = {}
+        if not sync_cache:
+            for url in urls:
+                content = self.lookup(url)
+                if content is not None:
+                    results[url] = content, True
+        misses = [url for url in urls if url not in results]
+        if misses:
+            fetched = list(zip(misses, fetch_all(misses)))
+            for url, content in fetched:
+                self.mem_cache[url] = content
+                results[url] = content, False
+            self.file_cache.set_many(fetched)
+        return [results[url] for url in urls]
+
     def sync_cache(self, url: str):
-        content, result = do_request(url)
+        content = do_request(url)
         self.mem_cache[url] = content
         self.file_cache[url] = content
-        return result, False
+        return content, False
+
@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Tuple
 
 
+@lru_cache(maxsize=4096)
 def image_info_from_url(url: str):
     sz_start, sz_end = size_coordinates(url)
     size = ImageSize.from_url(url[sz_start: sz_end])
@@ -12,8 +14,6 @@ def image_info_from_url(url: str):
 
 
 class ImageUrl:
-    IMAGE_URL_FORMAT = 'https://imdb-api.com/Images/{size}/{id}'
-
     @staticmethod
     def _calc_fit_dimensions(original_ratio: 'AspectRatio', desired_w, desired_h) -> Tuple[int, int]:
         desired_ratio = desired_w / desired_h
@@ -54,7 +54,7 @@ class ImageUrl:
 
     @classmethod
     def with_size(cls, id, size: 'ImageSize'):
-        return cls.IMAGE_URL_FORMAT.format(size=str(size), id=id)
+        return f'https://imdb-api.com/Images/{size}/{id}'
 
 
 class ImageSize(ABC):
@@ -63,7 +63,7 @@ class ImageSize(ABC):
         start, end = size_coordinates(url)
         size = url[start:end]
         if size.lower() == 'original':
-            return Original.value()
+            return _ORIGINAL
         else:
             return ImageSize.from_numXnum(size)
 
@@ -78,7 +78,7 @@ class ImageSize(ABC):
 
     @staticmethod
     def original():
-        return Original.value()
+        return _ORIGINAL
 
     @abstractmethod
     def aspect_ratio(self, original_a_r: 'AspectRatio'):
@@ -90,7 +90,7 @@ def size_coordinates(url: str) -> Tuple[int, int]:
     return start, url.find('/', start)
 
 
-@dataclass
+@dataclass(frozen=True)
 class Dimensions(ImageSize):
     width: int
     height: int
@@ -103,13 +103,16 @@ class Dimensions(ImageSize):
 
 
 class Original(ImageSize):
-    __instance = None
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
 
     @classmethod
     def value(cls):
-        if cls.__instance is None:
-            cls.__instance = cls()
-        return cls.__instance
+        return _ORIGINAL
 
     def aspect_ratio(self, original_a_r: 'AspectRatio'):
         return original_a_r
@@ -118,7 +121,7 @@ class Original(ImageSize):
         return 'original'
 
     def __repr__(self):
-        return 'Original.value()'
+        return 'Original()'
 
     def __eq__(self, other):
         return isinstance(other, Original)
@@ -127,18 +130,27 @@ class Original(ImageSize):
         return 15
 
 
+_ORIGINAL = Original()
+
+
 class AspectRatio:
 
     def __init__(self, large_version: int):
         if large_version <= 0 or large_version >= _conversion * 100:
             self._illegal_aspect_ratio(large_version / _conversion)
-        self.ratio = large_version
+        self._ratio = large_version
+
+    @property
+    def ratio(self):
+        return self._ratio
 
     @classmethod
+    @lru_cache(maxsize=512)
     def from_float(cls, float_version: float):
         return cls(int(float_version * _conversion))
 
     @classmethod
+    @lru_cache(maxsize=512)
     def from_str(cls, str_version: str):
         if ':' in str_version:
             return cls._from_str_ratio(str_version)
@@ -168,6 +180,7 @@ class AspectRatio:
         return cls.from_float(width / height)
 
     @classmethod
+    @lru_cache(maxsize=512)
     def from_url_or_id(cls, url: str):
         start = url.index('_Ratio') + 6
         return cls.from_str(url[start:-8])
@@ -34,9 +34,10 @@ class PosterSize(Enum):
     Square470 = 's470'
 
 
-class PosterUrl:
-    POSTER_URL_FORMAT = 'https://imdb-api.com/Posters/{size}/{id}'
+_VALUE_TO_POSTER_SIZE = {size.value: size for size in PosterSize}
+
 
+class PosterUrl:
     @classmethod
     def with_size(cls, id, size: PosterSize):
-        return cls.POSTER_URL_FORMAT.format(size=str(size), id=id)
+        return f'https://imdb-api.com/Posters/{size.value}/{id}'
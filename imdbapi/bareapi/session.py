@@ -0,0 +1,25 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def make_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]))
+    session.mount('https://', adapter)
+    return session
+
+
+SESSION = make_session()
+
+
+def fetch_all(urls: list[str], max_workers: int = 8) -> list[bytes]:
+    if len(urls) <= 1:
+        return [SESSION.get(url).content for url in urls]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        return list(executor.map(lambda url: SESSION.get(url).content, urls))
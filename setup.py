@@ -12,5 +12,5 @@ setuptools.setup(
         'Operating System :: OS Independent',],
     python_requires = '>=3.8',
     #package_dir = {'':''},
-    install_requires=['requests'],
+    install_requires=['requests', 'orjson', 'zstandard'],
 )